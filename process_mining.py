@@ -8,21 +8,177 @@ Usage: python process_mining.py
 """
 
 import sqlite3
+import numpy as np
+import openpyxl
 import pandas as pd
 import pm4py
 import os
 from pathlib import Path
+import matplotlib
+matplotlib.use('Agg')  # Only ever writes PNG files; skip GUI backend setup
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.collections import PatchCollection, PathCollection
 from collections import defaultdict
+from numba import njit
+
+# Rows streamed from each Excel sheet per batch, and rows per INSERT statement
+EXCEL_CHUNK_ROWS = 10_000
+SQL_CHUNK_ROWS = 1000
+SQLITE_MAX_VARIABLES = 32766
+
+# SQLite column types pandas.to_sql picks per inferred column kind
+SQLITE_TYPES = {'floating': 'REAL', 'integer': 'INTEGER', 'boolean': 'INTEGER',
+                'timedelta64': 'INTEGER', 'datetime64': 'TIMESTAMP', 'datetime': 'TIMESTAMP',
+                'date': 'DATE', 'time': 'TIME'}
+
+# Columns the ETL and the saved event log need from each table (everything
+# else only goes to SQLite)
+SHEET_COLUMNS = {
+    'customertable': ['CustomerID', 'SignUpDate', 'HasLoyaltyCard', 'ShippingAddress'],
+    'ordertable': ['OrderID', 'CustomerID', 'OrderDetails', 'OrderTotal',
+                   'OrderDate', 'PickedDate', 'PackedDate', 'Warehouse'],
+    'shippingtable': ['OrderID', 'DeliveryCompany', 'ShipmentID', 'PickUpDate', 'DeliveredDate'],
+    'supporttable': ['OrderID', 'TicketID', 'IssueCategory', 'TicketReceived',
+                     'TicketResolved', 'RefundIssued', 'SupportTeam', 'CustomerNPS'],
+}
+# Fixed dtypes so every chunk agrees, even when a column is empty in one of them
+SHEET_DTYPES = {
+    'customertable': {'SignUpDate': 'datetime64[ns]'},
+    'ordertable': {'OrderDate': 'datetime64[ns]', 'PickedDate': 'datetime64[ns]',
+                   'PackedDate': 'datetime64[ns]'},
+    'shippingtable': {'PickUpDate': 'datetime64[ns]', 'DeliveredDate': 'datetime64[ns]'},
+    'supporttable': {'TicketReceived': 'datetime64[ns]', 'TicketResolved': 'datetime64[ns]',
+                     'RefundIssued': 'datetime64[ns]'},
+}
+
+
+def sheet_frame(rows, columns):
+    """Build a chunk DataFrame, typing all-blank columns like pd.read_excel.
+
+    pd.read_excel gives a column with no values float64 NaN; without this a
+    blank column in one chunk would be an object column of None.
+    """
+    frame = pd.DataFrame(rows, columns=columns)
+    if len(frame):
+        blank = [column for column in frame.columns
+                 if frame[column].dtype == object and frame[column].isna().all()]
+        frame[blank] = frame[blank].astype('float64')
+    return frame
+
+
+def sqlite_type(column):
+    """SQLite column type pandas.to_sql would create for a column."""
+    return SQLITE_TYPES.get(pd.api.types.infer_dtype(column, skipna=True), 'TEXT')
+
+
+def sheet_header(header):
+    """Column names for a header row, named and de-duplicated like pd.read_excel.
+
+    Blank cells become 'Unnamed: <n>'. Repeated names get the first free
+    '.<k>' suffix, checked against the whole header, so 'a, a, a.1' becomes
+    'a, a.2, a.1'. Named columns are resolved before unnamed ones.
+    """
+    columns = [name if name is not None else f"Unnamed: {i}" for i, name in enumerate(header)]
+    unnamed = [i for i, name in enumerate(header) if name is None]
+    counts = defaultdict(int)
+    for i in [i for i in range(len(columns)) if i not in unnamed] + unnamed:
+        column = original = columns[i]
+        count = counts[column]
+        while count > 0:
+            counts[original] = count + 1
+            column = f"{original}.{count}"
+            count = count + 1 if column in columns else counts[column]
+        columns[i] = column
+        counts[column] = count + 1
+    return columns
+
+
+def iter_sheet_chunks(worksheet, chunk_rows=EXCEL_CHUNK_ROWS):
+    """Stream a worksheet as DataFrames of at most chunk_rows rows.
+
+    Reads through openpyxl's read-only row iterator so the whole sheet is
+    never materialised at once. Headers and rows follow pd.read_excel (see
+    sheet_header): blank trailing columns and rows are dropped and blank
+    interior rows are kept. Values to the right of the last header cell add
+    'Unnamed: <n>' columns, so a later chunk can have more columns than the
+    ones before it. A sheet without data rows yields one empty frame.
+    """
+    rows = worksheet.iter_rows(values_only=True)
+    header = next(rows, ())
+    width = max((i + 1 for i, name in enumerate(header) if name is not None), default=0)
+    columns = sheet_header(header[:width])
+
+    batch = []
+    blank_rows = 0  # Held back until a later data row shows they are interior
+    yielded = False
+    for row in rows:
+        last = max((i + 1 for i, value in enumerate(row) if value is not None), default=0)
+        if last == 0:
+            blank_rows += 1
+            continue
+        if last > width:
+            columns += [f"Unnamed: {i}" for i in range(width, last)]
+            batch = [previous + (None,) * (last - width) for previous in batch]
+            width = last
+        batch.extend([(None,) * width] * blank_rows)
+        blank_rows = 0
+        batch.append(tuple(row[:width]) + (None,) * (width - len(row)))
+        if len(batch) >= chunk_rows:
+            yield sheet_frame(batch, columns)
+            yielded = True
+            batch = []
+    if batch or not yielded:
+        yield sheet_frame(batch, columns)
+
+
+@njit(cache=True)
+def count_transitions(case_codes, activity_codes, n_activities):
+    """Count directly-follows pairs over events sorted by case and time.
+
+    Returns a flat n_activities x n_activities matrix, indexed by
+    source_code * n_activities + target_code.
+    """
+    counts = np.zeros(n_activities * n_activities, dtype=np.int64)
+    for i in range(len(case_codes) - 1):
+        if case_codes[i] == case_codes[i + 1]:
+            counts[activity_codes[i] * n_activities + activity_codes[i + 1]] += 1
+    return counts
+
+
+def discover_dfg(log, case_id_key='case:concept:name', activity_key='concept:name',
+                 timestamp_key='time:timestamp'):
+    """Discover the directly-follows graph from an event log dataframe.
+
+    Same signature and result as pm4py.discover_dfg on a dataframe, but works
+    on the sorted columns directly instead of building a PM4PY EventLog.
+    """
+    log = log.sort_values([case_id_key, timestamp_key], kind='stable')
+    cases = log[case_id_key]
+    activities = log[activity_key]
+
+    # Count each event -> next event pair within a case on integer codes
+    case_codes = pd.factorize(cases)[0]
+    activity_codes, activity_names = pd.factorize(activities)
+    n_activities = len(activity_names)
+    counts = count_transitions(case_codes, activity_codes, n_activities)
+    dfg = {(activity_names[i // n_activities], activity_names[i % n_activities]): int(counts[i])
+           for i in np.flatnonzero(counts)}
+
+    same_case = cases == cases.shift(-1)
+    first_of_case = cases != cases.shift(1)
+    start_activities = activities[first_of_case].value_counts(sort=False).to_dict()
+    end_activities = activities[~same_case].value_counts(sort=False).to_dict()
+
+    return dfg, start_activities, end_activities
 
 
 def create_fallback_visualization(dfg, event_log):
     """Create simple process flow diagram using matplotlib."""
 
-    # Extract unique activities and their frequencies
-    activities = sorted(event_log['Activities'].unique())
-    activity_counts = event_log['Activities'].value_counts()
+    # Extract unique activities and their frequencies in one pass
+    activity_counts = event_log.groupby('Activities', sort=True).size()
+    activities = activity_counts.index.tolist()
 
     # Create figure
     fig, ax = plt.subplots(1, 1, figsize=(14, 8))
@@ -31,22 +187,27 @@ def create_fallback_visualization(dfg, event_log):
 
     # Position activities vertically
     activity_positions = {}
+    activity_boxes = []
+    activity_labels = []
     for i, activity in enumerate(activities):
         y_pos = len(activities) - i
         activity_positions[activity] = (6, y_pos)
 
-        # Draw activity box
-        rect = patches.Rectangle((4.5, y_pos-0.4), 3, 0.8,
-                                 linewidth=2, edgecolor='navy', facecolor='lightblue', alpha=0.8)
-        ax.add_patch(rect)
+        # Activity box (drawn together as one collection below)
+        activity_boxes.append(patches.Rectangle((4.5, y_pos-0.4), 3, 0.8))
 
         # Clean activity name and add count
         clean_name = activity.replace('Date', '')
         count = activity_counts.get(activity, 0)
-        ax.text(6, y_pos, f"{clean_name}\n({count} events)",
-                ha='center', va='center', fontsize=10, weight='bold')
+        activity_labels.append((6, y_pos, f"{clean_name}\n({count} events)"))
+
+    ax.add_collection(PatchCollection(activity_boxes, linewidth=2, edgecolor='navy',
+                                      facecolor='lightblue', alpha=0.8))
 
     # Draw process flows with arrows
+    flow_paths = []
+    flow_widths = []
+    flow_labels = []
     for (source, target), frequency in dfg.items():
         if source in activity_positions and target in activity_positions:
             src_pos = activity_positions[source]
@@ -56,19 +217,32 @@ def create_fallback_visualization(dfg, event_log):
             start_x = src_pos[0] + 1.5
             end_x = tgt_pos[0] - 1.5
 
-            # Draw curved arrow
-            ax.annotate('', xy=(end_x, tgt_pos[1]),
-                        xytext=(start_x, src_pos[1]),
-                        arrowprops=dict(arrowstyle='->', lw=max(1, frequency/4),
-                                        color='darkgreen', alpha=0.8,
-                                        connectionstyle="arc3,rad=0.1"))
+            # Curved arrow (drawn together as one collection below); only
+            # the arrow geometry is kept, in data coordinates. The head is
+            # laid out in 100-dpi pixels, so 14 matches annotate's 10pt head
+            arrow = patches.FancyArrowPatch((start_x, src_pos[1]), (end_x, tgt_pos[1]),
+                                            arrowstyle='->', mutation_scale=14,
+                                            connectionstyle="arc3,rad=0.1",
+                                            transform=ax.transData)
+            flow_paths.append(arrow.get_path())
+            flow_widths.append(max(1, frequency/4))
 
             # Add frequency label
             mid_x = (start_x + end_x) / 2 + 0.5
             mid_y = (src_pos[1] + tgt_pos[1]) / 2
-            ax.text(mid_x, mid_y, str(frequency),
-                    ha='center', va='center', fontsize=9, weight='bold',
-                    bbox=dict(boxstyle="round,pad=0.2", facecolor='yellow', alpha=0.7))
+            flow_labels.append((mid_x, mid_y, str(frequency)))
+
+    ax.add_collection(PathCollection(flow_paths, linewidths=flow_widths, edgecolor='darkgreen',
+                                     facecolor='none', alpha=0.8))
+
+    # Draw labels from the collected positions with one shared style each
+    activity_label_style = dict(ha='center', va='center', fontsize=10, weight='bold')
+    flow_label_style = dict(ha='center', va='center', fontsize=9, weight='bold',
+                            bbox=dict(boxstyle="round,pad=0.2", facecolor='yellow', alpha=0.7))
+    for x, y, label in activity_labels:
+        ax.text(x, y, label, **activity_label_style)
+    for x, y, label in flow_labels:
+        ax.text(x, y, label, **flow_label_style)
 
     # Title and formatting
     ax.set_title('Process Flow Discovery Results\nExcel → SQLite → PM4PY Analysis',
@@ -79,7 +253,7 @@ def create_fallback_visualization(dfg, event_log):
 • Total Cases: {event_log['OrderID'].nunique()}
 • Total Events: {len(event_log)}
 • Activity Types: {len(activities)}
-• Time Span: {(pd.to_datetime(event_log['Timestamp']).max() - pd.to_datetime(event_log['Timestamp']).min()).days} days"""
+• Time Span: {(event_log['Timestamp'].max() - event_log['Timestamp'].min()).days} days"""
 
     ax.text(0.5, 1, stats_text, fontsize=11, verticalalignment='top',
             bbox=dict(boxstyle="round,pad=0.5", facecolor='lightyellow', alpha=0.9))
@@ -88,8 +262,8 @@ def create_fallback_visualization(dfg, event_log):
     ax.axis('off')
 
     plt.tight_layout()
-    plt.savefig('output/process_map_matplotlib.png', dpi=300,
-                bbox_inches='tight', facecolor='white')
+    plt.savefig('output/process_map_matplotlib.png', dpi=150,
+                bbox_inches=None, facecolor='white')
     plt.close()
 
 
@@ -109,120 +283,137 @@ def main():
     print("📥 STEP 1: Load Excel → SQLite")
     print("-" * 30)
 
-    # Load Excel data into SQLite
-    conn = sqlite3.connect("output/process_data.db")
-    xl = pd.ExcelFile(excel_file)
-
+    # Stream Excel data into SQLite (kept as an output; the ETL runs in pandas)
+    conn = sqlite3.connect("file:output/process_data.db?mode=rwc", uri=True)
+    # One-shot bulk-load settings: to_sql commits after every call, so make
+    # those commits cheap (in-memory journal, no fsync) without WAL's sidecar
+    # files or mmap, which are unsafe on the bind-mounted output folder; and
+    # give SQLite a 256 MB page cache instead of the 2 MB default
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-262144")
+    # One pass over the .xlsx container: sheets are parsed lazily, once each,
+    # and external links are not loaded at all
+    workbook = openpyxl.load_workbook(excel_file, read_only=True, data_only=True,
+                                      keep_links=False)
+
+    tables = {}
     tables_loaded = 0
-    for sheet_name in xl.sheet_names:
+    for worksheet in workbook.worksheets:
+        sheet_name = worksheet.title
         if sheet_name == 'DB structure':  # Skip metadata sheet
             continue
 
-        df = pd.read_excel(excel_file, sheet_name=sheet_name)
         table_name = sheet_name.lower().replace(" ", "")
-        df.to_sql(table_name, conn, if_exists='replace', index=False)
-        print(f"  ✓ {sheet_name} → {len(df)} rows")
+        keep_columns = SHEET_COLUMNS.get(table_name)
+        rows = 0
+        chunks = []
+        sql_types = {}
+        for i, chunk in enumerate(iter_sheet_chunks(worksheet)):
+            # The first chunk (possibly empty) creates the table from the header.
+            # Column types are pinned from the first chunk that has the column,
+            # so later chunks cannot change them; columns that only show up in
+            # a later chunk are added to the existing table
+            for column in chunk.columns:
+                if column not in sql_types:
+                    sql_types[column] = sqlite_type(chunk[column])
+                    if i > 0:
+                        quoted = str(column).replace('"', '""')
+                        conn.execute(f'ALTER TABLE "{table_name}" ADD COLUMN "{quoted}" '
+                                     f'{sql_types[column]}')
+            chunk.to_sql(table_name, conn, if_exists='replace' if i == 0 else 'append',
+                         index=False, method='multi', dtype=sql_types,
+                         chunksize=min(SQL_CHUNK_ROWS, SQLITE_MAX_VARIABLES // max(1, len(chunk.columns))))
+            rows += len(chunk)
+            # Only the columns the ETL uses stay in memory
+            if keep_columns:
+                chunks.append(chunk[keep_columns].astype(SHEET_DTYPES[table_name]))
+        if keep_columns:
+            tables[table_name] = pd.concat(chunks, ignore_index=True)
+        print(f"  ✓ {sheet_name} → {rows} rows")
         tables_loaded += 1
 
+    workbook.close()
+    conn.close()
     print(f"✅ Loaded {tables_loaded} tables into SQLite")
 
     print("\n🔄 STEP 2: ETL Transformation (Unpivot + Concatenate)")
     print("-" * 50)
 
-    # SQL query that replicates KNIME unpivot + concatenate operations
-    event_log_query = """
-    WITH unpivoted_events AS (
-        -- ORDER TABLE EVENTS (using column names as activities)
-        SELECT OrderID, 'OrderDate' as Activities, OrderDate as Timestamp, 'order' as source_type
-        FROM ordertable WHERE OrderDate IS NOT NULL
-        UNION ALL
-        SELECT OrderID, 'PickedDate', PickedDate, 'order' 
-        FROM ordertable WHERE PickedDate IS NOT NULL
-        UNION ALL  
-        SELECT OrderID, 'PackedDate', PackedDate, 'order'
-        FROM ordertable WHERE PackedDate IS NOT NULL
-        UNION ALL
-        -- SHIPPING TABLE EVENTS (using column names as activities)
-        SELECT OrderID, 'DeliveredDate', DeliveredDate, 'shipping'
-        FROM shippingtable WHERE DeliveredDate IS NOT NULL
-        UNION ALL
-        SELECT OrderID, 'PickUpDate', PickUpDate, 'shipping'  
-        FROM shippingtable WHERE PickUpDate IS NOT NULL
-        UNION ALL
-        -- SUPPORT TABLE EVENTS (using column names as activities)
-        SELECT OrderID, 'TicketReceived', TicketReceived, 'support'
-        FROM supporttable WHERE TicketReceived IS NOT NULL
-        UNION ALL
-        SELECT OrderID, 'TicketResolved', TicketResolved, 'support'
-        FROM supporttable WHERE TicketResolved IS NOT NULL
-        UNION ALL
-        SELECT OrderID, 'RefundIssued', RefundIssued, 'support'
-        FROM supporttable WHERE RefundIssued IS NOT NULL
+    order_df = tables['ordertable']
+    customer_df = tables['customertable']
+    ship_df = tables['shippingtable']
+    sup_df = tables['supporttable']
+
+    # Unpivot each table's date columns (column names become activities),
+    # replicating the KNIME unpivot + concatenate operations
+    event_frames = [
+        df[['OrderID'] + date_columns]
+        .melt(id_vars='OrderID', var_name='Activities', value_name='Timestamp')
+        .dropna(subset=['Timestamp'])
+        for df, date_columns in [
+            (order_df, ['OrderDate', 'PickedDate', 'PackedDate']),
+            (ship_df, ['DeliveredDate', 'PickUpDate']),
+            (sup_df, ['TicketReceived', 'TicketResolved', 'RefundIssued']),
+        ]
+    ]
+    # Timestamps are already datetime64 here: the date columns are cast once
+    # at load (SHEET_DTYPES) and everything downstream reuses them as is
+    events = pd.concat(event_frames, ignore_index=True)
+
+    # Attach the resource columns used for attribution (one per source table).
+    # Combine them per order first so the event rows are joined only once.
+    resources = (order_df[['OrderID', 'Warehouse']]
+                 .merge(ship_df[['OrderID', 'DeliveryCompany']], on='OrderID', how='outer')
+                 .merge(sup_df[['OrderID', 'SupportTeam']], on='OrderID', how='outer'))
+    event_log = (
+        events
+        .merge(resources, on='OrderID', how='left')
+        .sort_values(['OrderID', 'Timestamp'], kind='stable', ignore_index=True)
     )
-    
-    -- JOIN with all tables to create enriched event log
-    SELECT 
-        ue.OrderID,
-        ue.Activities,
-        ue.Timestamp,
-        c.CustomerID,
-        c.ShippingAddress,
-        o.OrderDetails,
-        o.OrderTotal,
-        o.Warehouse,
-        s.DeliveryCompany,
-        s.ShipmentID,
-        sup.TicketID,
-        sup.SupportTeam,
-        sup.IssueCategory,
-        sup.CustomerNPS,
-        c.SignUpDate,
-        c.HasLoyaltyCard
-    FROM unpivoted_events ue
-    LEFT JOIN ordertable o ON ue.OrderID = o.OrderID
-    LEFT JOIN customertable c ON o.CustomerID = c.CustomerID  
-    LEFT JOIN shippingtable s ON ue.OrderID = s.OrderID
-    LEFT JOIN supporttable sup ON ue.OrderID = sup.OrderID
-    ORDER BY ue.OrderID, ue.Timestamp
-    """
-
-    # Execute transformation
-    event_log = pd.read_sql_query(event_log_query, conn)
-    conn.close()
+    # Resource names repeat on every event; store them dictionary-encoded
+    event_log = event_log.astype({'Warehouse': 'category', 'DeliveryCompany': 'category',
+                                  'SupportTeam': 'category'})
 
     print(f"  ✓ Event log created: {len(event_log)} events")
     print(f"  ✓ Unique cases: {event_log['OrderID'].nunique()}")
     print(f"  ✓ Activities: {sorted(event_log['Activities'].unique())}")
 
-    # Save intermediate result
-    event_log.to_csv('output/event_log.csv', index=False)
-    print(f"  ✓ Saved: event_log.csv")
+    # Save intermediate result, enriched with order, customer, shipping and
+    # support details (only the saved file needs them, not discovery)
+    enriched_log = (
+        event_log
+        .merge(order_df[['OrderID', 'CustomerID', 'OrderDetails', 'OrderTotal']],
+               on='OrderID', how='left')
+        .merge(customer_df, on='CustomerID', how='left')
+        .merge(ship_df[['OrderID', 'ShipmentID']], on='OrderID', how='left')
+        .merge(sup_df[['OrderID', 'TicketID', 'IssueCategory', 'CustomerNPS']],
+               on='OrderID', how='left')
+    )
+    enriched_log[[
+        'OrderID', 'Activities', 'Timestamp', 'CustomerID', 'ShippingAddress',
+        'OrderDetails', 'OrderTotal', 'Warehouse', 'DeliveryCompany', 'ShipmentID',
+        'TicketID', 'SupportTeam', 'IssueCategory', 'CustomerNPS', 'SignUpDate',
+        'HasLoyaltyCard'
+    ]].to_parquet('output/event_log.parquet', engine='pyarrow',
+                  compression='snappy', index=False)
+    print(f"  ✓ Saved: event_log.parquet")
 
     print("\n🔍 STEP 3: Process Discovery & Visualization")
     print("-" * 40)
 
-    # Convert to PM4PY format
-    pm4py_log = event_log.rename(columns={
+    # Convert to PM4PY format, keeping only the columns discovery uses
+    pm4py_log = event_log[['OrderID', 'Activities', 'Timestamp']].rename(columns={
         'OrderID': 'case:concept:name',
         'Activities': 'concept:name',
         'Timestamp': 'time:timestamp'
-    }).copy()
-
-    # Convert timestamp and add resource
-    pm4py_log['time:timestamp'] = pd.to_datetime(pm4py_log['time:timestamp'])
-    pm4py_log['org:resource'] = pm4py_log.apply(lambda row:
-                                                row['Warehouse'] if pd.notna(row['Warehouse']) else
-                                                row['DeliveryCompany'] if pd.notna(row['DeliveryCompany']) else
-                                                row['SupportTeam'] if pd.notna(row['SupportTeam']) else 'Unknown', axis=1)
-
-    # Create PM4PY event log
-    event_log_pm4py = pm4py.convert_to_event_log(
-        pm4py_log[['case:concept:name', 'concept:name',
-                   'time:timestamp', 'org:resource']]
-    )
+    })
 
     # Discover process flows
-    dfg, start_activities, end_activities = pm4py.discover_dfg(event_log_pm4py)
+    dfg, start_activities, end_activities = discover_dfg(
+        pm4py_log, case_id_key='case:concept:name', activity_key='concept:name',
+        timestamp_key='time:timestamp')
 
     print(f"  ✓ Process flows discovered:")
     for (source, target), frequency in dfg.items():
@@ -261,7 +452,6 @@ def main():
         f"  ✓ Least common activity: {activity_counts.index[-1]} ({activity_counts.iloc[-1]}x)")
 
     # Time-based analysis
-    event_log['Timestamp'] = pd.to_datetime(event_log['Timestamp'])
     date_range = event_log['Timestamp'].max() - event_log['Timestamp'].min()
     print(f"  ✓ Data spans: {date_range.days} days")
 
@@ -269,7 +459,7 @@ def main():
     print("=" * 50)
     print("📄 Files created:")
     print("  • process_data.db     (SQLite database)")
-    print("  • event_log.csv       (Process event log)")
+    print("  • event_log.parquet   (Process event log)")
 
     # Check which visualization files exist
     if os.path.exists("output/process_map.png"):
@@ -282,7 +472,7 @@ def main():
         print("  • Open output/process_map.png to see your process flow")
     elif os.path.exists("output/process_map_matplotlib.png"):
         print("  • Open output/process_map_matplotlib.png to see your process flow")
-    print("  • Analyze output/event_log.csv for detailed insights")
+    print("  • Analyze output/event_log.parquet for detailed insights")
     print("  • Use PM4PY for advanced process mining")
     print("  • Replace with your own Excel data")
 